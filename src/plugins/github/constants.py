@@ -7,7 +7,9 @@ TITLE_MAX_LENGTH = 50
 
 # 匹配信息的正则表达式
 # 格式：### {标题}\n\n{内容}
-ISSUE_PATTERN = r"### {}\s+([^\s#].*?)(?=(?:\s+###|$))"
+# 内容为标题后的第一行，之后需紧跟下一个标题或文本结尾
+# 空白字符整段匹配且不回溯，避免长空白导致匹配耗时成平方增长
+ISSUE_PATTERN = r"### {}\s+([^\s#](?:\S|[^\S\n]++(?!\s*###))*+)(?=\s+###|[^\S\n]*\n?\Z)"
 ISSUE_FIELD_TEMPLATE = "### {}"
 ISSUE_FIELD_PATTERN = r"### {}\s+"
 
@@ -32,13 +32,14 @@ from .constants import (
 )
 from .render import render_summary
 
+_ansi_escape_regex = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 def strip_ansi(text: str | None) -> str:
     """去除 ANSI 转义字符"""
     if not text:
         return ""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ansi_escape_regex.sub("", text)
 
 
 def add_step_summary(summary: str):
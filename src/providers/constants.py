@@ -38,3 +38,9 @@ STORE_PLUGINS_URL = f"{STORE_BASE_URL}/plugins.json5"
 # https://github.com/orgs/nonebot/packages/container/package/nonetest
 DOCKER_IMAGES_VERSION = os.environ.get("DOCKER_IMAGES_VERSION") or "latest"
 DOCKER_IMAGES = f"ghcr.io/nonebot/nonetest:{DOCKER_IMAGES_VERSION}"
+
+# 插件测试容器共享的缓存卷，默认不挂载
+# 设置后挂载到容器内的 /root/.cache，uv 下载的依赖与 Python 可在多次测试间复用
+# 注意：插件代码在容器内以 root 运行，可以修改缓存中的文件，
+# 之后测试的插件会使用这些文件，所以只应在信任所测插件时开启
+DOCKER_CACHE_VOLUME = os.environ.get("DOCKER_CACHE_VOLUME")
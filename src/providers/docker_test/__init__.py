@@ -1,10 +1,11 @@
+import asyncio
 import json
 from typing import TypedDict
 
 import docker
 from pydantic import BaseModel, SkipValidation, field_validator
 
-from src.providers.constants import DOCKER_IMAGES
+from src.providers.constants import DOCKER_CACHE_VOLUME, DOCKER_IMAGES
 
 
 class Metadata(TypedDict):
@@ -64,7 +65,9 @@ class DockerPluginTest:
 
         try:
             # 运行 Docker 容器，捕获输出。 容器内运行的代码拥有超时设限，此处无需设置超时
-            output = client.containers.run(
+            # 在线程中等待容器结束，以便同时测试多个插件
+            output = await asyncio.to_thread(
+                client.containers.run,
                 DOCKER_IMAGES,
                 environment={
                     # 运行测试的 Python 版本
@@ -74,9 +77,16 @@ class DockerPluginTest:
                     "MODULE_NAME": self.module_name,
                     "PLUGIN_CONFIG": self.config,
                 },
+                # 共享依赖缓存，容器本身仍在测试后删除
+                volumes=(
+                    {DOCKER_CACHE_VOLUME: {"bind": "/root/.cache", "mode": "rw"}}
+                    if DOCKER_CACHE_VOLUME
+                    else None
+                ),
                 detach=False,
                 remove=True,
-            ).decode()
+            )
+            # 容器输出为 UTF-8 编码的 JSON，直接解析字节即可
             data = json.loads(output)
         except Exception as e:
             data = {
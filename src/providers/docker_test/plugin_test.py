@@ -5,25 +5,35 @@
 # ruff: noqa: T201, ASYNC109
 
 import asyncio
+import contextlib
 import json
 import os
 import re
-from asyncio import create_subprocess_shell, subprocess
+import signal
+from asyncio import create_subprocess_exec, subprocess
+from functools import cached_property
 from pathlib import Path
 
 import httpx
 
 from src.providers.constants import REGISTRY_PLUGINS_URL
+from src.providers.utils import get_pypi_version
 
 from .render import render_fake, render_runner
 
+# 测试虚拟环境中的 Python，相对于测试目录
+VENV_PYTHON = ".venv/bin/python"
+# 命令超时后等待其响应 SIGTERM 的时间，超过后强制结束
+TERMINATE_TIMEOUT = 10
+
+_ansi_escape_regex = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
 
 def strip_ansi(text: str | None) -> str:
     """去除 ANSI 转义字符"""
     if not text:
         return ""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ansi_escape_regex.sub("", text)
 
 
 def get_plugin_list() -> dict[str, str]:
@@ -50,43 +60,49 @@ def canonicalize_name(name: str) -> str:
     return _canonicalize_regex.sub("-", name).lower()
 
 
+# uv pip show 输出中的版本
+_show_version_regex = re.compile(r"^Version:\s+(\S+)", re.MULTILINE)
+
+
 def extract_version(output: str, project_link: str) -> str | None:
     """提取插件版本"""
     output = strip_ansi(output)
 
-    # 匹配 poetry show 的输出
-    match = re.search(r"version\s+:\s+(\S+)", output)
+    # 匹配 uv pip show 的输出
+    match = _show_version_regex.search(output)
     if match:
         return match.group(1).strip()
 
-    # poetry 使用 packaging.utils 中的 canonicalize_name 规范化名称
+    # uv 使用 packaging.utils 中的 canonicalize_name 规范化名称
     # 在这里我们也需要规范化名称，以正确匹配版本号
     project_link = canonicalize_name(project_link)
 
-    # 匹配版本解析失败的情况
-    match = re.search(
-        rf"depends on {project_link} \(\^(\S+)\), version solving failed\.", output
-    )
+    # 安装成功、版本解析失败与构建失败时，uv 都以 name==version 的形式输出插件版本
+    #  + nonebot-plugin-treehelp==0.5.0
+    # numpy==2.3.0 depends on Python>=3.11, we can conclude ...
+    # error: Failed to build `numpy==1.21.0`
+    match = re.search(rf"(?<![\w.-]){re.escape(project_link)}==([^\s`,;]+)", output)
     if match:
         return match.group(1).strip()
 
-    # 插件安装失败的情况
-    match = re.search(rf"Using version \^(\S+) for {project_link}", output)
-    if match:
-        return match.group(1).strip()
 
-    match = re.search(rf"- Installing {project_link} \((\S+)\)", output)
-    if match:
-        return match.group(1).strip()
+# uv venv 输出中虚拟环境的 Python 版本
+# 系统中的 Python：Using CPython 3.12.7 interpreter at: /usr/local/bin/python3.12
+# uv 管理的 Python：Using CPython 3.12.8
+_venv_python_regex = re.compile(r"^Using \S+ (\d\S*)", re.MULTILINE)
+
+
+# uv pip freeze 的输出
+# anyio==4.6.2.post1
+# nonebot2==2.4.0
+_requirement_regex = re.compile(r"^(.+?)(?:\[.+\])?==([^\s;]+)")
 
 
 def parse_requirements(requirements: str) -> dict[str, str]:
     """解析 requirements.txt 文件"""
-    # anyio==3.6.2 ; python_version >= "3.11" and python_version < "4.0"
-    # pydantic[dotenv]==1.10.6 ; python_version >= "3.10" and python_version < "4.0"
     results = {}
     for line in requirements.strip().splitlines():
-        match = re.match(r"^(.+?)(?:\[.+\])?==(.+) ;", line)
+        match = _requirement_regex.match(line)
         if match:
             package_name = match.group(1)
             version = match.group(2)
@@ -94,6 +110,14 @@ def parse_requirements(requirements: str) -> dict[str, str]:
     return results
 
 
+async def read_stream(stream: asyncio.StreamReader | None, chunks: list[bytes]) -> None:
+    """持续读取流中的内容直到结束"""
+    if stream is None:
+        return
+    while chunk := await stream.read(65536):
+        chunks.append(chunk)
+
+
 class PluginTest:
     def __init__(
         self,
@@ -137,19 +161,17 @@ class PluginTest:
         """
         return f"{self.project_link}:{self.module_name}"
 
-    @property
+    @cached_property
     def env(self) -> dict[str, str]:
-        """获取环境变量"""
+        """获取环境变量
+
+        测试过程中不会变化，只需生成一次
+        """
         env = os.environ.copy()
-        # 删除虚拟环境变量，防止 poetry 使用运行当前脚本的虚拟环境
+        # 删除虚拟环境变量，防止 uv 使用运行当前脚本的虚拟环境
         env.pop("VIRTUAL_ENV", None)
         # 启用 LOGURU 的颜色输出
         env["LOGURU_COLORIZE"] = "true"
-        # Poetry 配置
-        # https://python-poetry.org/docs/configuration/#virtualenvsin-project
-        env["POETRY_VIRTUALENVS_IN_PROJECT"] = "true"
-        # https://python-poetry.org/docs/configuration/#virtualenvsprefer-active-python-experimental
-        env["POETRY_VIRTUALENVS_PREFER_ACTIVE_PYTHON"] = "true"
         return env
 
     def _log_output(self, msg: str):
@@ -159,23 +181,23 @@ class PluginTest:
     async def run(self):
         """插件测试入口"""
         # 创建插件测试项目
-        await self.create_poetry_project()
+        await self.create_project()
         if self._create:
-            await asyncio.gather(
-                self.show_package_info(),
-                self.show_plugin_dependencies(),
-                self.get_python_version(),
-            )
-            await self.run_poetry_project()
+            tasks = [self.show_package_info(), self.show_plugin_dependencies()]
+            if self._test_python_version == "unknown":
+                tasks.append(self.get_python_version())
+            await asyncio.gather(*tasks)
+            await self.run_project()
 
         # 补上获取到 Python 版本
         self._test_env.insert(0, f"python=={self._test_python_version}")
         # 读取插件元数据
-        metadata = None
-        metadata_path = self._test_dir / "metadata.json"
-        if metadata_path.exists():
+        # 插件没有元数据或加载失败时不会生成该文件
+        try:
             with open(self._test_dir / "metadata.json", encoding="utf-8") as f:
                 metadata = json.load(f)
+        except FileNotFoundError:
+            metadata = None
 
         result = {
             "metadata": metadata,
@@ -190,52 +212,110 @@ class PluginTest:
         print(json.dumps(result, ensure_ascii=False))
         return result
 
-    async def command(self, cmd: str, timeout: int = 300) -> tuple[bool, str, str]:
+    async def command(self, *cmd: str, timeout: int = 300) -> tuple[bool, str, str]:
         """执行命令
 
+        直接启动程序，不经过 shell，参数也无需转义
+
         Args:
-            cmd (str): 命令
+            *cmd (str): 程序及其参数
             timeout (int, optional): 超时限制. Defaults to 300.
 
         Returns:
             tuple[bool, str, str]: 命令执行返回值，标准输出，标准错误
         """
-        proc = await create_subprocess_shell(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self._test_dir,
-            env=self.env,
-        )
         try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
-            code = proc.returncode
+            proc = await create_subprocess_exec(
+                *cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=self._test_dir,
+                env=self.env,
+                # 放入单独的进程组，超时时可以一并结束命令启动的子进程
+                start_new_session=True,
+            )
+        except OSError as e:
+            # 不经过 shell 时，找不到程序会直接抛出异常
+            return False, "", str(e)
+        # 边运行边读取输出，超时时已读取的内容也不会丢失
+        stdout_chunks: list[bytes] = []
+        stderr_chunks: list[bytes] = []
+
+        async def communicate() -> int:
+            await asyncio.gather(
+                read_stream(proc.stdout, stdout_chunks),
+                read_stream(proc.stderr, stderr_chunks),
+            )
+            return await proc.wait()
+
+        try:
+            code = await asyncio.wait_for(communicate(), timeout)
         except TimeoutError:
-            proc.terminate()
-            # 超时后仍需读取 stdout 与 stderr 的内容
-            stdout = "执行命令超时\n".encode()
-            stdout += await proc.stdout.read() if proc.stdout else b""
-            stderr = await proc.stderr.read() if proc.stderr else b""
+            # 进程组可能已经自行退出
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), TERMINATE_TIMEOUT)
+            except TimeoutError:
+                # 忽略 SIGTERM 的命令直接强制结束，避免容器一直挂起
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(proc.pid, signal.SIGKILL)
+                await proc.wait()
+            stdout_chunks.insert(0, "执行命令超时\n".encode())
             code = 1
 
+        stdout = b"".join(stdout_chunks)
+        stderr = b"".join(stderr_chunks)
         return not code, stdout.decode(), stderr.decode()
 
-    async def create_poetry_project(self):
-        """创建 poetry 项目用来测试插件"""
+    async def create_project(self):
+        """创建虚拟环境并安装插件用来测试
+
+        测试只需要能导入插件与 nonebot 的虚拟环境，直接使用 uv 安装即可，
+        不需要 poetry 的项目与锁文件
+        """
         if not self._test_dir.exists():
             self._test_dir.mkdir()
 
-            code, stdout, stderr = await self.command(
-                f"""uv venv --python {self.python_version} && poetry init -n --python "~{self.python_version}" && poetry env info --ansi && poetry add {self.project_link}"""
+            # 固定安装 PyPI 上的最新版本
+            # 否则最新版本无法安装时，uv 会退回到能安装的旧版本进行测试
+            latest_version = await asyncio.to_thread(
+                get_pypi_version, self.project_link
+            )
+            requirement = (
+                f"{self.project_link}=={latest_version}"
+                if latest_version
+                else self.project_link
             )
 
+            commands = [
+                ("uv", "venv", "--python", self.python_version),
+                ("uv", "pip", "install", "--python", VENV_PYTHON, requirement),
+            ]
+            # 依次执行，任意一步失败则停止
+            code, stdout, stderr = True, "", ""
+            for cmd in commands:
+                code, cmd_stdout, cmd_stderr = await self.command(*cmd)
+                stdout += cmd_stdout
+                stderr += cmd_stderr
+                if not code:
+                    break
+
             self._create = code
 
             if self._create:
+                # uv venv 已输出虚拟环境的 Python 版本，无需再次获取
+                match = _venv_python_regex.search(strip_ansi(stdout + stderr))
+                if match:
+                    self._test_python_version = match.group(1)
+
                 self._log_output(f"项目 {self.project_link} 创建成功。")
-                self._std_output(stdout)
+                # uv 的输出都在标准错误流中
+                self._std_output(stdout, stderr)
             else:
                 # 创建失败时尝试从报错中获取插件版本号
+                # 安装时固定了最新版本，解析或构建失败的报错中会包含该版本
+                # 而创建虚拟环境失败、网络错误或超时并不能说明最新版本无法测试
                 self._version = extract_version(stdout + stderr, self.project_link)
 
                 self._log_output(f"项目 {self.project_link} 创建失败：")
@@ -249,7 +329,7 @@ class PluginTest:
         """获取插件的版本与插件信息"""
         if self._test_dir.exists():
             code, stdout, stderr = await self.command(
-                f"poetry show {self.project_link}"
+                "uv", "pip", "show", "--python", VENV_PYTHON, self.project_link
             )
             if code:
                 # 获取插件版本
@@ -262,7 +342,7 @@ class PluginTest:
                 self._log_output(f"插件 {self.project_link} 信息获取失败。")
                 self._std_output(stdout, stderr)
 
-    async def run_poetry_project(self) -> None:
+    async def run_project(self) -> None:
         """运行插件"""
         if self._test_dir.exists():
             # 默认使用 fake 驱动
@@ -281,8 +361,11 @@ class PluginTest:
             with open(self._test_dir / "runner.py", "w", encoding="utf-8") as f:
                 f.write(runner_script)
 
+            # 测试目录已存在时，不能读取到上次运行留下的元数据
+            (self._test_dir / "metadata.json").unlink(missing_ok=True)
+
             code, stdout, stderr = await self.command(
-                "poetry run python runner.py", timeout=600
+                VENV_PYTHON, "runner.py", timeout=600
             )
 
             self._run = code
@@ -297,12 +380,14 @@ class PluginTest:
     async def show_plugin_dependencies(self) -> None:
         """获取插件的依赖"""
         if self._test_dir.exists():
-            code, stdout, stderr = await self.command("poetry export --without-hashes")
+            code, stdout, stderr = await self.command(
+                "uv", "pip", "freeze", "--python", VENV_PYTHON
+            )
 
             if code:
                 self._log_output(f"插件 {self.project_link} 依赖的插件如下：")
                 requirements = parse_requirements(stdout)
-                self._deps = self._get_deps(requirements)
+                self._deps = await self._get_deps(requirements)
                 self._test_env = self._get_test_env(requirements)
                 self._log_output(f"    {', '.join(self._deps)}")
             else:
@@ -312,7 +397,7 @@ class PluginTest:
     async def get_python_version(self):
         """获取 Python 版本"""
         if self._test_dir.exists():
-            code, stdout, stderr = await self.command("poetry run python --version")
+            code, stdout, stderr = await self.command(VENV_PYTHON, "--version")
             if code:
                 version = stdout.strip()
                 if version.startswith("Python "):
@@ -321,33 +406,33 @@ class PluginTest:
                 self._log_output("Python 版本获取失败。")
                 self._std_output(stdout, stderr)
 
-    @property
-    def plugin_list(self) -> dict[str, str]:
-        """获取插件列表"""
+    async def get_plugin_list(self) -> dict[str, str]:
+        """获取插件列表
+
+        在线程中请求，避免阻塞同时运行的其他命令
+        """
         if self._plugin_list is None:
-            self._plugin_list = get_plugin_list()
+            self._plugin_list = await asyncio.to_thread(get_plugin_list)
         return self._plugin_list
 
     def _std_output(self, stdout: str, stderr: str = ""):
         """将标准输出流与标准错误流记录并输出"""
-        _out = stdout.strip().splitlines()
-        _err = stderr.strip().splitlines()
-
-        for i in _out:
-            self._log_output(f"    {i}")
-        for i in _err:
-            self._log_output(f"    {i}")
+        lines = stdout.strip().splitlines() + stderr.strip().splitlines()
+        if lines:
+            # 缩进后整段记录，不必逐行追加
+            self._log_output("\n".join(f"    {i}" for i in lines))
 
-    def _get_deps(self, requirements: dict[str, str]) -> list[str]:
+    async def _get_deps(self, requirements: dict[str, str]) -> list[str]:
         """获取插件依赖"""
+        plugin_list = await self.get_plugin_list()
         deps = []
         for package_name in requirements:
             if (
-                package_name in self.plugin_list
+                package_name in plugin_list
                 # 不用包括插件自己
                 and package_name != canonicalize_name(self.project_link)
             ):
-                module_name = self.plugin_list[package_name]
+                module_name = plugin_list[package_name]
                 deps.append(module_name)
         return deps
 
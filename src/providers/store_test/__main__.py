@@ -37,8 +37,6 @@ def registry_update():
 @click.option("-k", "--key", default=None, show_default=True, help="测试插件标识符")
 def plugin_test(limit: int, offset: int, force: bool, key: str | None):
     """插件测试"""
-    from .store import StoreTest
-
     test = StoreTest()
 
     if key:
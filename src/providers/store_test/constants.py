@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 TEST_DIR = Path("plugin_test")
@@ -23,3 +24,6 @@ PLUGINS_PATH = TEST_DIR / "plugins.json"
 
 PLUGIN_CONFIG_PATH = TEST_DIR / "plugin_configs.json"
 """ 生成的插件配置保存路径 """
+
+MAX_CONCURRENT_TESTS = os.cpu_count() or 1
+""" 同时运行的插件测试数量上限 """
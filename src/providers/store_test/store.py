@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 from src.providers.constants import (
@@ -39,6 +40,7 @@ from .constants import (
     ADAPTERS_PATH,
     BOTS_PATH,
     DRIVERS_PATH,
+    MAX_CONCURRENT_TESTS,
     PLUGIN_CONFIG_PATH,
     PLUGINS_PATH,
     RESULTS_PATH,
@@ -79,6 +81,10 @@ class StoreTest:
             ): StorePlugin(**plugin)
             for plugin in load_json_from_web(STORE_PLUGINS_URL)
         }
+        # 验证插件支持的适配器时使用，不用每次都重新获取
+        self._store_adapter_names: set[str] = {
+            adapter.module_name for adapter in self._store_adapters.values()
+        }
         # 上次测试的结果
         self._previous_results: dict[str, StoreTestResult] = {
             key: StoreTestResult(**value)
@@ -170,6 +176,7 @@ class StoreTest:
             store_plugin=plugin,
             config=config,
             previous_plugin=self._previous_plugins.get(key),
+            store_adapters=self._store_adapter_names,
         )
         return new_result, new_plugin
 
@@ -183,30 +190,48 @@ class StoreTest:
         """
         new_results: dict[str, StoreTestResult] = {}
         new_plugins: dict[str, RegistryPlugin] = {}
-        i = 1
-        test_plugins = list(self._store_plugins.keys())[offset:]
-
-        for key in test_plugins:
-            if i > limit:
-                logger.info(f"已达到测试上限 {limit}，测试停止")
-                break
+        test_plugins = iter(list(self._store_plugins.keys())[offset:])
+        # 测试成功与正在测试的插件数量，跳过与测试失败的插件不计入上限
+        count = 0
+
+        async def worker():
+            nonlocal count
+            while count < limit:
+                key = next(test_plugins, None)
+                if key is None:
+                    return
+
+                # 先占用名额，避免等待期间其他 worker 领取超过上限的插件
+                count += 1
+                # 是否需要跳过测试
+                # 获取 PyPI 版本会阻塞，放到线程中运行，避免阻塞其他 worker
+                if await asyncio.to_thread(self.should_skip, key, force):
+                    count -= 1
+                    continue
+
+                try:
+                    logger.info(f"{count}/{limit} 正在测试插件 {key} ...")
+                    new_result, new_plugin = await self.test_plugin(key)
+                except Exception as err:
+                    logger.error(f"{err}")
+                    count -= 1
+                    continue
 
-            # 是否需要跳过测试
-            if self.should_skip(key, force):
-                continue
-
-            async def worker():
-                new_result, new_plugin = await self.test_plugin(key)
                 new_results[key] = new_result
                 new_plugins[key] = new_plugin
 
-            try:
-                logger.info(f"{i}/{limit} 正在测试插件 {key} ...")
-                await worker()  # TODO: 修改为并行
-                i += 1
-            except Exception as err:
-                logger.error(f"{err}")
-                continue
+        # 同时运行多个测试，每个 worker 依次领取待测试的插件
+        await asyncio.gather(*(worker() for _ in range(MAX_CONCURRENT_TESTS)))
+        if count >= limit:
+            logger.info(f"已达到测试上限 {limit}，测试停止")
+
+        # 测试结果按完成顺序记录，按商店中的顺序重新排列
+        new_results = {
+            key: new_results[key] for key in self._store_plugins if key in new_results
+        }
+        new_plugins = {
+            key: new_plugins[key] for key in self._store_plugins if key in new_plugins
+        }
 
         summary = self.generate_github_summary(new_results)
         add_step_summary(summary)
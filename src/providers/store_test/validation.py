@@ -1,5 +1,6 @@
 """测试并验证插件"""
 
+import asyncio
 from typing import Any
 
 from src.providers.docker_test import DockerPluginTest
@@ -18,11 +19,14 @@ async def validate_plugin(
     store_plugin: StorePlugin,
     config: str,
     previous_plugin: RegistryPlugin | None = None,
+    store_adapters: set[str] | None = None,
 ):
     """验证插件
 
     如果 previous_plugin 为 None，说明是首次验证插件
 
+    批量测试时可传入 store_adapters，避免每个插件都重新获取商店中的适配器
+
     返回测试结果与验证后的插件数据
 
     如果插件验证失败，返回的插件数据为 None
@@ -31,13 +35,18 @@ async def validate_plugin(
     project_link = store_plugin.project_link
     module_name = store_plugin.module_name
 
-    # 从 PyPI 获取信息
-    pypi_time = get_pypi_upload_time(project_link)
-
-    # 测试插件
-    plugin_test_result = await DockerPluginTest(project_link, module_name, config).run(
-        "3.12"
+    # 测试插件的同时从 PyPI 获取信息
+    # 网络请求放在线程中，避免阻塞同时进行的其他插件测试
+    pypi_time, plugin_test_result = await asyncio.gather(
+        asyncio.to_thread(get_pypi_upload_time, project_link),
+        DockerPluginTest(project_link, module_name, config).run("3.12"),
+        return_exceptions=True,
     )
+    # 等插件测试结束后再抛出错误，不留下仍在运行的测试容器
+    if isinstance(plugin_test_result, BaseException):
+        raise plugin_test_result
+    if isinstance(pypi_time, BaseException):
+        raise pypi_time
 
     plugin_test_load = plugin_test_result.load
     plugin_test_output = plugin_test_result.output
@@ -82,7 +91,7 @@ async def validate_plugin(
 
     # 通过 Github API 获取插件作者名称
     try:
-        author_name = get_author_name(store_plugin.author_id)
+        author_name = await asyncio.to_thread(get_author_name, store_plugin.author_id)
     except Exception:
         # 若无法请求，试图从上次的插件数据中获取
         author_name = previous_plugin.author if previous_plugin else ""
@@ -92,7 +101,9 @@ async def validate_plugin(
     raw_data["time"] = pypi_time
 
     # 验证插件信息
-    result: ValidationDict = validate_info(PublishType.PLUGIN, raw_data, [])
+    result: ValidationDict = validate_info(
+        PublishType.PLUGIN, raw_data, [], store_adapters
+    )
 
     if result.valid:
         assert isinstance(result.info, PluginPublishInfo)
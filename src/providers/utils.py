@@ -22,7 +22,8 @@ def load_json_from_web(url: str):
     r = httpx.get(url)
     if r.status_code != 200:
         raise ValueError(f"下载文件失败：{r.text}")
-    return pyjson5.decode(r.text)
+    # 直接解析 UTF-8 字节，不必先解码出完整的字符串
+    return pyjson5.decode_buffer(r.content, wordlength=0)
 
 
 def load_json(text: str):
@@ -42,13 +43,12 @@ def dumps_json(data: Any, minify: bool = True) -> str:
 def dump_json(path: str | Path, data: Any, minify: bool = True) -> None:
     """保存 JSON 文件"""
     data = to_jsonable_python(data)
+    # json.dump 会使用纯 Python 实现的编码器逐块写入
+    # 先用 json.dumps 生成完整内容再一次写入，压缩时可以使用 C 实现的编码器
+    content = dumps_json(data, minify)
 
     with open(path, "w", encoding="utf-8") as f:
-        if minify:
-            # 为减少文件大小，还需手动设置 separators
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
-        else:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write(content)
 
 
 def dump_json5(path: Path, data: Any) -> None:
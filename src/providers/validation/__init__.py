@@ -30,6 +30,7 @@ def validate_info(
     publish_type: PublishType,
     raw_data: dict[str, Any],
     previous_data: list[dict[str, Any]] | None,
+    store_adapters: set[str] | None = None,
 ) -> ValidationDict:
     """根据发布类型验证数据是否符合规范
 
@@ -37,6 +38,7 @@ def validate_info(
         publish_type (PublishType): 发布类型
         raw_data (dict[str, Any]): 原始数据
         previous_data (list[dict[str, Any]] | None): 当前商店数据，用于验证数据是否重复
+        store_adapters (set[str] | None): 商店中的适配器，为 None 时从网络获取
     """
     context = {
         "previous_data": previous_data,
@@ -45,6 +47,7 @@ def validate_info(
         # 存放在 context 中方便 FieldValidator 使用
         "test_output": raw_data.get("test_output", ""),  # 测试输出
         "skip_test": raw_data.get("skip_test", False),  # 是否跳过测试
+        "store_adapters": store_adapters,  # 商店中的适配器
     }
 
     info: PublishInfoModels | None = None
@@ -279,7 +279,9 @@ class PluginPublishInfo(PublishInfo, PyPIMixin):
             raise PydanticCustomError("set_type", "值应该是一个集合")
 
         supported_adapters = {resolve_adapter_name(x) for x in v}
-        store_adapters = get_adapters()
+        store_adapters = context.get("store_adapters")
+        if store_adapters is None:
+            store_adapters = get_adapters()
 
         missing_adapters = supported_adapters - store_adapters
         if missing_adapters:
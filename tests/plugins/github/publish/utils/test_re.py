@@ -41,3 +41,23 @@ async def test_missing_info():
 
     assert tags is not None
     assert tags.group(1).strip() == "[]"
+
+
+async def test_long_whitespace():
+    """内容中包含大段空白时，匹配耗时不应成平方增长"""
+    import time
+
+    from src.plugins.github.plugins.publish.constants import PLUGIN_NAME_PATTERN
+
+    body = (
+        "### 插件名称\r\n\r\nname"
+        + " " * 100000
+        + "name\r\n\r\n### 插件描述\r\n\r\ndesc"
+    )
+
+    start = time.perf_counter()
+    name = PLUGIN_NAME_PATTERN.search(body)
+    assert time.perf_counter() - start < 1
+
+    assert name is not None
+    assert name.group(1).strip() == "name" + " " * 100000 + "name"
@@ -51,6 +51,7 @@ async def test_docker_plugin_test(mocked_api: MockRouter, mocker: MockerFixture)
                 "PYTHON_VERSION": "3.12",
             }
         ),
+        volumes=None,
         detach=False,
         remove=True,
     )
@@ -92,6 +93,7 @@ async def test_docker_plugin_test_exception(
                 "PYTHON_VERSION": "3.12",
             }
         ),
+        volumes=None,
         detach=False,
         remove=True,
     )
@@ -158,6 +160,7 @@ async def test_docker_plugin_test_metadata_some_fields_empty(
                 "PYTHON_VERSION": "3.12",
             }
         ),
+        volumes=None,
         detach=False,
         remove=True,
     )
@@ -224,6 +227,31 @@ async def test_docker_plugin_test_metadata_some_fields_invalid(
                 "PYTHON_VERSION": "3.12",
             }
         ),
+        volumes=None,
         detach=False,
         remove=True,
     )
+
+
+async def test_docker_plugin_test_cache_volume(
+    mocked_api: MockRouter, mocker: MockerFixture
+):
+    """设置缓存卷后挂载到容器中"""
+    from src.providers.docker_test import DockerPluginTest
+
+    mocker.patch("src.providers.docker_test.DOCKER_CACHE_VOLUME", "noneflow-cache")
+    mocked_run = mocker.Mock()
+    mocked_run.return_value = json.dumps(
+        {"run": True, "load": True, "output": "test"}
+    ).encode()
+    mocked_client = mocker.Mock()
+    mocked_client.containers.run = mocked_run
+    mocked_docker = mocker.patch("docker.DockerClient")
+    mocked_docker.return_value = mocked_client
+
+    test = DockerPluginTest("project_link", "module_name")
+    await test.run("3.12")
+
+    assert mocked_run.call_args.kwargs["volumes"] == {
+        "noneflow-cache": {"bind": "/root/.cache", "mode": "rw"}
+    }
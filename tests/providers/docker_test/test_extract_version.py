@@ -2,26 +2,15 @@ from pathlib import Path
 
 
 def test_extract_version(tmp_path: Path):
-    """poetry show 的输出"""
+    """uv pip show 的输出"""
     from src.providers.docker_test.plugin_test import extract_version
 
     output = """
- name         : nonebot2
- version      : 2.0.1
- description  : An asynchronous python bot framework.
-
-dependencies
- - httpx >=0.20.0,<1.0.0
- - loguru >=0.6.0,<1.0.0
- - pydantic >=1.10.0,<2.0.0
- - pygtrie >=2.4.1,<3.0.0
- - tomli >=2.0.1,<3.0.0
- - typing-extensions >=4.0.0,<5.0.0
- - yarl >=1.7.2,<2.0.0
-
-required by
- - nonebot-adapter-github >=2.0.0-beta.5,<3.0.0
- - nonebug >=2.0.0-rc.2,<3.0.0
+Name: nonebot2
+Version: 2.0.1
+Location: /app/plugin_test/.venv/lib/python3.12/site-packages
+Requires: httpx, loguru, pydantic, pygtrie, tomli, typing-extensions, yarl
+Required-by: nonebot-adapter-github, nonebug
 """
 
     version = extract_version(output, "nonebot2")
@@ -29,77 +18,41 @@ required by
 
 
 def test_extract_version_resolve_failed(tmp_path: Path):
-    """版本解析失败的情况"""
+    """安装的最新版本不支持当前 Python 版本的情况"""
     from src.providers.docker_test.plugin_test import extract_version
 
     output = """
 项目 ELF-RSS 创建失败：
-    Virtualenv
-    Python:         3.12.7
-    Implementation: CPython
-    Path:           NA
-    Executable:     NA
-
-    Base
-    Platform:   linux
-    OS:         posix
-    Python:     3.12.7
-    Path:       /usr/local
-    Executable: /usr/local/bin/python3.12
-    Using version ^2.6.25 for elf-rss
-
-    Updating dependencies
-    Resolving dependencies...
-    Creating virtualenv elf-rss-elf-rss2 in /tmp/plugin_test/ELF-RSS-ELF_RSS2/.venv
-
-    The current project's supported Python range (>=3.12,<3.13) is not compatible with some of the required packages Python requirement:
-      - elf-rss requires Python <4.0.0,>=3.12.6, so it will not be satisfied for Python >=3.12,<3.12.6
-
-    Because no versions of elf-rss match >2.6.25,<3.0.0
-     and elf-rss (2.6.25) requires Python <4.0.0,>=3.12.6, elf-rss is forbidden.
-    So, because elf-rss-elf-rss2 depends on elf-rss (^2.6.25), version solving failed.
-
-      • Check your dependencies Python requirement: The Python requirement can be specified via the `python` or `markers` properties
-
-        For elf-rss, a possible solution would be to set the `python` property to ">=3.12.6,<3.13"
-
-        https://python-poetry.org/docs/dependency-specification/#python-restricted-dependencies,
-        https://python-poetry.org/docs/dependency-specification/#using-environment-markers
+    Using CPython 3.12.7
+    Creating virtual environment at: .venv
+    Activate with: source .venv/bin/activate
+    error: No solution found when resolving dependencies
+      cause: Because the current Python version (3.12.7) does not satisfy Python>=3.13 and elf-rss==2.7.0 depends on Python>=3.13, we can conclude that elf-rss==2.7.0 cannot be used.
+             And because you require elf-rss==2.7.0, we can conclude that your requirements are unsatisfiable.
 """
 
     version = extract_version(output, "ELF-RSS")
 
-    assert version == "2.6.25"
+    assert version == "2.7.0"
 
     version = extract_version(output, "nonebot2")
 
     assert version is None
 
 
-def test_extract_version_install_failed(tmp_path: Path):
-    """安装插件失败的情况"""
+def test_extract_version_build_failed(tmp_path: Path):
+    """构建插件失败的情况"""
     from src.providers.docker_test.plugin_test import extract_version
 
     output = """
 项目 nonebot-plugin-ncm 创建失败：
-    Virtualenv
-    Python:         3.12.7
-    Implementation: CPython
-    Path:           NA
-    Executable:     NA
-
-    Base
-    Platform:   linux
-    OS:         posix
-    Python:     3.12.7
-    Path:       /usr/local
-    Executable: /usr/local/bin/python3.12
-    Using version ^1.6.16 for nonebot-plugin-ncm
-
-    Updating dependencies
-    Resolving dependencies...
-
-    Package operations: 32 installs, 0 updates, 0 removals
+    Using CPython 3.12.7 interpreter at: /usr/local/bin/python3.12
+    Creating virtual environment at: .venv
+    Activate with: source .venv/bin/activate
+    Resolved 32 packages in 1.21s
+       Building nonebot-plugin-ncm==1.6.16
+    error: Failed to build `nonebot-plugin-ncm==1.6.16`
+      cause: The build backend returned an error
 """
 
     version = extract_version(output, "nonebot-plugin-ncm")
@@ -115,25 +68,26 @@ def test_extract_version_install_failed(tmp_path: Path):
     assert version is None
 
 
-def test_extract_version_install_failed_partial_output(tmp_path: Path):
-    """安装插件失败的情况，输出不知道为什么只剩下了部分
-
-    TODO: 弄清楚为什么输出不完整。
-    """
+def test_extract_version_similar_name(tmp_path: Path):
+    """不会匹配到名称相近的其他包"""
     from src.providers.docker_test.plugin_test import extract_version
 
     output = """
-项目 nonebot-plugin-todo-nlp 创建失败：
-    执行命令超时
-    - Installing nonebot-plugin-todo-nlp (0.1.9)
-
-    Writing lock file
+Resolved 3 packages in 0.52s
+Installed 3 packages in 10ms
+ + nonebot-plugin-todo-nlp==0.1.9
+ + nonebot-plugin-todo==0.2.0
+ + nonebot2==2.4.0
 """
 
+    version = extract_version(output, "nonebot-plugin-todo")
+
+    assert version == "0.2.0"
+
     version = extract_version(output, "nonebot-plugin-todo-nlp")
 
     assert version == "0.1.9"
 
-    version = extract_version(output, "nonebot2")
+    version = extract_version(output, "todo")
 
     assert version is None
@@ -12,80 +12,76 @@ async def test_plugin_test(mocker: MockerFixture, tmp_path: Path):
 
     mocker.patch.object(test, "_test_dir", tmp_path / "plugin_test")
 
-    def command_output(cmd: str, timeout: int = 300):
-        if (
-            cmd
-            == 'uv venv --python 3.12 && poetry init -n --python "~3.12" && poetry env info --ansi && poetry add project_link'
+    def command_output(*cmd: str, timeout: int = 300):
+        # create_project
+        if cmd == ("uv", "venv", "--python", "3.12"):
+            # 镜像中没有 Python 3.12，由 uv 下载
+            return (
+                True,
+                "",
+                """\
+Using CPython 3.12.7
+Creating virtual environment at: .venv
+Activate with: source .venv/bin/activate
+""",
+            )
+        if cmd == (
+            "uv",
+            "pip",
+            "install",
+            "--python",
+            ".venv/bin/python",
+            "project_link==0.5.0",
         ):
-            # create_poetry_project
             return (
                 True,
-                """
-    Virtualenv
-    Python:         3.12.7
-    Implementation: CPython
-    Path:           NA
-    Executable:     NA
-
-    Base
-    Platform:   linux
-    OS:         posix
-    Python:     3.12.7
-    Path:       /usr/local
-    Executable: /usr/local/bin/python3.12
-    Using version ^0.5.0 for nonebot-plugin-treehelp
-
-    Updating dependencies
-    Resolving dependencies...
-
-    Package operations: 16 installs, 0 updates, 0 removals
-
-      - Installing typing-extensions (4.12.2)
-      - Installing annotated-types (0.7.0)
-      - Installing idna (3.10)
-      - Installing multidict (6.1.0)
-      - Installing propcache (0.2.0)
-      - Installing pydantic-core (2.23.4)
-      - Installing sniffio (1.3.1)
-      - Installing anyio (4.6.2.post1)
-      - Installing exceptiongroup (1.2.2)
-      - Installing loguru (0.7.2)
-      - Installing pydantic (2.9.2)
-      - Installing pygtrie (2.5.0)
-      - Installing python-dotenv (1.0.1)
-      - Installing yarl (1.17.2)
-      - Installing nonebot2 (2.4.0)
-      - Installing nonebot-plugin-treehelp (0.5.0)
-
-    Writing lock file""",
                 "",
+                """\
+Resolved 16 packages in 2.77s
+Prepared 16 packages in 3.08s
+Installed 16 packages in 14ms
+ + annotated-types==0.7.0
+ + anyio==4.6.2.post1
+ + exceptiongroup==1.2.2
+ + idna==3.10
+ + loguru==0.7.2
+ + multidict==6.1.0
+ + nonebot-plugin-treehelp==0.5.0
+ + nonebot2==2.4.0
+ + propcache==0.2.0
+ + pydantic==2.10.0
+ + pydantic-core==2.27.0
+ + pygtrie==2.5.0
+ + python-dotenv==1.0.1
+ + sniffio==1.3.1
+ + typing-extensions==4.12.2
+ + yarl==1.17.2""",
             )
-        if cmd == "poetry show project_link":
+        if cmd == ("uv", "pip", "show", "--python", ".venv/bin/python", "project_link"):
             # show_package_info
             return (
                 True,
-                """
-    name         : nonebot-plugin-treehelp
-     version      : 0.5.0
-     description  : 适用于 Nonebot2 的树形帮助插件
-
-    dependencies
-     - nonebot2 >=2.2.0""",
+                """\
+Name: nonebot-plugin-treehelp
+Version: 0.5.0
+Location: /app/plugin_test/.venv/lib/python3.12/site-packages
+Requires: nonebot2
+Required-by:""",
                 "",
             )
-        if cmd == "poetry export --without-hashes":
+        if cmd == ("uv", "pip", "freeze", "--python", ".venv/bin/python"):
             # show_plugin_dependencies
             return (
                 True,
-                """
-nonebot2==2.4.0 ; python_version >= "3.9" and python_version < "4.0"
-pydantic-core==2.27.0 ; python_version >= "3.9" and python_version < "4.0"
-pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
-                    """,
+                """\
+nonebot2==2.4.0
+pydantic-core==2.27.0
+pydantic==2.10.0
+""",
                 "",
             )
-        if cmd == "poetry run python runner.py":
-            # run_plugin_test
+        if cmd == (".venv/bin/python", "runner.py"):
+            # run_project
             with open(tmp_path / "plugin_test" / "metadata.json", "w") as f:
                 json.dump(
                     {
@@ -99,7 +95,7 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
                     f,
                 )
             return (True, "", "")
-        if cmd == "poetry run python --version":
+        if cmd == (".venv/bin/python", "--version"):
             return (True, "Python 3.12.7", "")
 
         raise ValueError(f"Unknown command: {cmd}")
@@ -111,6 +107,10 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
         "src.providers.docker_test.plugin_test.get_plugin_list"
     )
     mocked_get_plugin_list.return_value = {}
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_pypi_version",
+        return_value="0.5.0",
+    )
 
     result = await test.run()
     assert result == snapshot(
@@ -125,50 +125,34 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
             },
             "output": """\
 项目 project_link 创建成功。
-    Virtualenv
-        Python:         3.12.7
-        Implementation: CPython
-        Path:           NA
-        Executable:     NA
-    
-        Base
-        Platform:   linux
-        OS:         posix
-        Python:     3.12.7
-        Path:       /usr/local
-        Executable: /usr/local/bin/python3.12
-        Using version ^0.5.0 for nonebot-plugin-treehelp
-    
-        Updating dependencies
-        Resolving dependencies...
-    
-        Package operations: 16 installs, 0 updates, 0 removals
-    
-          - Installing typing-extensions (4.12.2)
-          - Installing annotated-types (0.7.0)
-          - Installing idna (3.10)
-          - Installing multidict (6.1.0)
-          - Installing propcache (0.2.0)
-          - Installing pydantic-core (2.23.4)
-          - Installing sniffio (1.3.1)
-          - Installing anyio (4.6.2.post1)
-          - Installing exceptiongroup (1.2.2)
-          - Installing loguru (0.7.2)
-          - Installing pydantic (2.9.2)
-          - Installing pygtrie (2.5.0)
-          - Installing python-dotenv (1.0.1)
-          - Installing yarl (1.17.2)
-          - Installing nonebot2 (2.4.0)
-          - Installing nonebot-plugin-treehelp (0.5.0)
-    
-        Writing lock file
+    Using CPython 3.12.7
+    Creating virtual environment at: .venv
+    Activate with: source .venv/bin/activate
+    Resolved 16 packages in 2.77s
+    Prepared 16 packages in 3.08s
+    Installed 16 packages in 14ms
+     + annotated-types==0.7.0
+     + anyio==4.6.2.post1
+     + exceptiongroup==1.2.2
+     + idna==3.10
+     + loguru==0.7.2
+     + multidict==6.1.0
+     + nonebot-plugin-treehelp==0.5.0
+     + nonebot2==2.4.0
+     + propcache==0.2.0
+     + pydantic==2.10.0
+     + pydantic-core==2.27.0
+     + pygtrie==2.5.0
+     + python-dotenv==1.0.1
+     + sniffio==1.3.1
+     + typing-extensions==4.12.2
+     + yarl==1.17.2
 插件 project_link 的信息如下：
-    name         : nonebot-plugin-treehelp
-         version      : 0.5.0
-         description  : 适用于 Nonebot2 的树形帮助插件
-    
-        dependencies
-         - nonebot2 >=2.2.0
+    Name: nonebot-plugin-treehelp
+    Version: 0.5.0
+    Location: /app/plugin_test/.venv/lib/python3.12/site-packages
+    Requires: nonebot2
+    Required-by:
 插件 project_link 依赖的插件如下：
     
 插件 module_name 加载正常：\
@@ -183,3 +167,132 @@ pydantic==2.10.0 ; python_version >= "3.9" and python_version < "4.0"
 
     mocked_get_plugin_list.assert_called_once()
     mocked_command.assert_called()
+    # Python 版本已从 uv venv 的输出中获取
+    assert mocker.call(".venv/bin/python", "--version") not in (
+        mocked_command.call_args_list
+    )
+
+
+async def test_plugin_test_command_timeout(tmp_path: Path):
+    """命令超时时，仍保留超时前的输出"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    test._test_dir = tmp_path
+
+    code, stdout, stderr = await test.command(
+        "sh", "-c", "echo before; echo error >&2; sleep 10", timeout=1
+    )
+
+    assert not code
+    assert stdout.startswith("执行命令超时\n")
+    assert "before" in stdout
+    assert "error" in stderr
+
+
+async def test_plugin_test_command_timeout_ignore_sigterm(
+    mocker: MockerFixture, tmp_path: Path
+):
+    """命令忽略 SIGTERM 时强制结束"""
+    from src.providers.docker_test import plugin_test
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    mocker.patch.object(plugin_test, "TERMINATE_TIMEOUT", 0.5)
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    test._test_dir = tmp_path
+
+    code, stdout, _ = await test.command(
+        "sh", "-c", "trap '' TERM; echo before; sleep 10", timeout=1
+    )
+
+    assert not code
+    assert stdout.startswith("执行命令超时\n")
+    assert "before" in stdout
+
+
+async def test_plugin_test_existing_dir(mocker: MockerFixture, tmp_path: Path):
+    """测试目录已存在时，不读取上次运行留下的元数据"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    test._test_dir = tmp_path
+    (tmp_path / "metadata.json").write_text('{"name": "stale"}')
+
+    mocked_command = mocker.patch.object(test, "command")
+    mocked_command.return_value = (False, "", "error")
+
+    result = await test.run()
+
+    assert result["run"] is True
+    assert result["load"] is False
+    assert result["metadata"] is None
+
+
+async def test_plugin_test_latest_unsupported(mocker: MockerFixture, tmp_path: Path):
+    """最新版本不支持测试的 Python 版本时，测试失败，不退回到旧版本"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "ELF-RSS", "ELF_RSS2")
+    test._test_dir = tmp_path / "plugin_test"
+
+    def command_output(*cmd: str, timeout: int = 300):
+        if cmd == ("uv", "venv", "--python", "3.12"):
+            return (True, "", "Using CPython 3.12.7\n")
+        if cmd == (
+            "uv",
+            "pip",
+            "install",
+            "--python",
+            ".venv/bin/python",
+            "ELF-RSS==2.7.0",
+        ):
+            return (
+                False,
+                "",
+                """\
+error: No solution found when resolving dependencies
+  cause: Because the current Python version (3.12.7) does not satisfy Python>=3.13 and elf-rss==2.7.0 depends on Python>=3.13, we can conclude that elf-rss==2.7.0 cannot be used.
+         And because you require elf-rss==2.7.0, we can conclude that your requirements are unsatisfiable.
+""",
+            )
+        raise ValueError(f"Unknown command: {cmd}")
+
+    mocked_command = mocker.patch.object(test, "command")
+    mocked_command.side_effect = command_output
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_pypi_version",
+        return_value="2.7.0",
+    )
+
+    result = await test.run()
+
+    assert result["run"] is False
+    assert result["load"] is False
+    assert result["version"] == "2.7.0"
+    assert mocked_command.call_count == 2
+
+
+async def test_plugin_test_venv_failed(mocker: MockerFixture, tmp_path: Path):
+    """创建虚拟环境失败时，不记录插件版本，之后仍会重新测试"""
+    from src.providers.docker_test.plugin_test import PluginTest
+
+    test = PluginTest("3.12", "project_link", "module_name")
+    test._test_dir = tmp_path / "plugin_test"
+
+    mocked_command = mocker.patch.object(test, "command")
+    mocked_command.return_value = (
+        False,
+        "",
+        "error: Failed to download https://github.com/astral-sh/python-build-standalone/releases/download/20241016/cpython-3.12.7%2B20241016-x86_64-unknown-linux-gnu-install_only_stripped.tar.gz\n",
+    )
+    mocker.patch(
+        "src.providers.docker_test.plugin_test.get_pypi_version",
+        return_value="0.5.0",
+    )
+
+    result = await test.run()
+
+    assert result["run"] is False
+    assert result["version"] is None
+    mocked_command.assert_called_once_with("uv", "venv", "--python", "3.12")
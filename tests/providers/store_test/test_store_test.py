@@ -90,6 +90,7 @@ async def test_store_test(
             skip_test=False,
         ),
         config="TEST_CONFIG=true",
+        store_adapters={"nonebot.adapters.onebot.v11", "nonebot.adapters.onebot.v12"},
     )
     assert mocked_api["pypi_nonebot-plugin-treehelp"].called
     assert mocked_api["pypi_nonebot-plugin-datastore"].called
@@ -158,6 +159,7 @@ async def test_store_test_with_key(
             skip_test=False,
         ),
         config="TEST_CONFIG=true",
+        store_adapters={"nonebot.adapters.onebot.v11", "nonebot.adapters.onebot.v12"},
     )
 
     assert mocked_api["pypi_nonebot-plugin-treehelp"].called
@@ -225,6 +227,10 @@ async def test_store_test_raise(
                 ),
                 previous_plugin=None,
                 config="",
+                store_adapters={
+                    "nonebot.adapters.onebot.v11",
+                    "nonebot.adapters.onebot.v12",
+                },
             ),  # type: ignore
         ]
     )
@@ -278,6 +284,7 @@ async def test_store_test_with_key_raise(
         ),
         previous_plugin=None,
         config="",
+        store_adapters={"nonebot.adapters.onebot.v11", "nonebot.adapters.onebot.v12"},
     )
 
     # 数据没有更新，只是被压缩
@@ -296,3 +303,57 @@ async def test_store_test_with_key_raise(
     assert mocked_store_data["results"].read_text(encoding="utf-8") == snapshot(
         '{"nonebot-plugin-datastore:nonebot_plugin_datastore":{"time":"2023-06-26T22:08:18.945584+08:00","config":"","version":"1.3.0","test_env":null,"results":{"validation":true,"load":true,"metadata":true},"outputs":{"validation":null,"load":"datastore","metadata":{"name":"数据存储","description":"NoneBot 数据存储插件","usage":"请参考文档","type":"library","homepage":"https://github.com/he0119/nonebot-plugin-datastore","supported_adapters":null}}},"nonebot-plugin-treehelp:nonebot_plugin_treehelp":{"time":"2023-06-26T22:20:41.833311+08:00","config":"","version":"0.3.0","test_env":null,"results":{"validation":true,"load":true,"metadata":true},"outputs":{"validation":null,"load":"treehelp","metadata":{"name":"帮助","description":"获取插件帮助信息","usage":"获取插件列表\\n/help\\n获取插件树\\n/help -t\\n/help --tree\\n获取某个插件的帮助\\n/help 插件名\\n获取某个插件的树\\n/help --tree 插件名\\n","type":"application","homepage":"https://github.com/he0119/nonebot-plugin-treehelp","supported_adapters":null}}}}'
     )
+
+
+async def test_store_test_concurrent(
+    mocked_store_data: dict[str, Path], mocked_api: MockRouter, mocker: MockerFixture
+):
+    """同时测试多个插件
+
+    第一个插件测试报错，不计入上限，空出的位置由第三个插件补上
+    第三个插件先于第二个插件完成，结果仍按商店中的顺序排列
+    """
+    import asyncio
+
+    from src.providers.store_test import store
+    from src.providers.store_test.store import StoreTest, StoreTestResult
+
+    mocker.patch.object(store, "MAX_CONCURRENT_TESTS", 3)
+    mocked_add_step_summary = mocker.patch.object(store, "add_step_summary")
+
+    async def validate_plugin(store_plugin, **kwargs):
+        if store_plugin.project_link == "nonebot-plugin-datastore":
+            await asyncio.sleep(0.01)
+            raise Exception("测试失败")
+        if store_plugin.project_link == "nonebot-plugin-treehelp":
+            await asyncio.sleep(0.1)
+        else:
+            await asyncio.sleep(0.02)
+        return (
+            StoreTestResult(
+                version="1.0.0",
+                results={"validation": True, "load": True, "metadata": True},
+                outputs={"validation": None, "load": "", "metadata": None},
+            ),
+            store_plugin.project_link,
+        )
+
+    mocked_validate_plugin = mocker.patch.object(store, "validate_plugin")
+    mocked_validate_plugin.side_effect = validate_plugin
+
+    test = StoreTest()
+    new_results, new_plugins = await test.test_plugins(limit=2, offset=0, force=True)
+
+    assert mocked_validate_plugin.call_count == 3
+    assert list(new_results) == [
+        "nonebot-plugin-treehelp:nonebot_plugin_treehelp",
+        "nonebot-plugin-wordcloud:nonebot_plugin_wordcloud",
+    ]
+    assert list(new_plugins.values()) == [
+        "nonebot-plugin-treehelp",
+        "nonebot-plugin-wordcloud",
+    ]
+    summary = mocked_add_step_summary.call_args.args[0]
+    assert summary.index("nonebot-plugin-treehelp") < summary.index(
+        "nonebot-plugin-wordcloud"
+    )
@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import pytest
 from inline_snapshot import snapshot
 from pytest_mock import MockerFixture
 from respx import MockRouter
@@ -91,6 +92,39 @@ async def test_validate_plugin(
     assert mocked_api["homepage"].called
 
 
+async def test_validate_plugin_with_store_adapters(
+    mocked_api: MockRouter, mocker: MockerFixture, mock_datetime, tmp_path: Path
+) -> None:
+    """传入商店适配器时，不再从网络获取适配器列表"""
+    from src.providers.models import StorePlugin
+    from src.providers.store_test.validation import validate_plugin
+
+    output = json.loads((Path(__file__).parent / "output.json").read_text())
+    output["metadata"]["supported_adapters"] = ["~onebot.v11"]
+    output_path = tmp_path / "output.json"
+    output_path.write_text(json.dumps(output))
+    mock_docker_result(output_path, mocker)
+
+    plugin = StorePlugin(
+        module_name="module_name",
+        project_link="project_link",
+        author_id=1,
+        tags=[],
+        is_official=True,
+    )
+
+    result, new_plugin = await validate_plugin(
+        plugin, "", store_adapters={"nonebot.adapters.onebot.v11"}
+    )
+
+    assert result.results == snapshot(
+        {"validation": True, "load": True, "metadata": True}
+    )
+    assert new_plugin.supported_adapters == snapshot(["nonebot.adapters.onebot.v11"])
+
+    assert not mocked_api["store_adapter"].called
+
+
 async def test_validate_plugin_with_previous(
     mocked_api: MockRouter, mocker: MockerFixture, mock_datetime
 ) -> None:
@@ -487,3 +521,35 @@ async def test_validate_plugin_failed_with_previous(
     )
 
     assert mocked_api["homepage"].called
+
+
+async def test_validate_plugin_pypi_error(
+    mocked_api: MockRouter, mocker: MockerFixture, mock_datetime
+) -> None:
+    """获取上传时间报错时，等待插件测试完成后再抛出错误"""
+    from src.providers.models import StorePlugin
+    from src.providers.store_test import validation
+    from src.providers.store_test.validation import validate_plugin
+
+    spy_validate_info = mocker.spy(validation, "validate_info")
+    mocked_api["pypi_project_link"].respond(
+        json={"info": {"name": "project_link", "version": "0.0.1"}, "urls": []}
+    )
+    output_path = Path(__file__).parent / "output.json"
+    mock_plugin_test = mock_docker_result(output_path, mocker)
+
+    plugin = StorePlugin(
+        module_name="module_name",
+        project_link="project_link",
+        author_id=1,
+        tags=[],
+        is_official=True,
+    )
+
+    with pytest.raises(IndexError):
+        await validate_plugin(plugin, "")
+
+    mock_plugin_test.run.assert_awaited_once_with("3.12")
+    assert mocked_api["pypi_project_link"].called
+    # 错误在验证插件信息之前抛出
+    spy_validate_info.assert_not_called()